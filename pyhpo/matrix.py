@@ -171,6 +171,38 @@ class Matrix:
         for x in range(self.n_cols):
             yield self[None, x]
 
+    def row_maxes(self) -> List[Any]:
+        """
+        Returns the maximum value of every row
+
+        Returns
+        -------
+        list
+            The maximum value of each row, top to bottom
+        """
+        return [
+            max(self._data[row * self.n_cols:(row + 1) * self.n_cols])
+            for row in range(self.n_rows)
+        ]
+
+    def col_maxes(self) -> List[Any]:
+        """
+        Returns the maximum value of every column
+
+        Returns
+        -------
+        list
+            The maximum value of each column, left to right
+        """
+        # Single pass over the underlying data instead of
+        # building every strided column slice separately
+        maxes = self._data[0:self.n_cols]
+        for idx, value in enumerate(self._data[self.n_cols:]):
+            col = idx % self.n_cols
+            if value > maxes[col]:
+                maxes[col] = value
+        return maxes
+
     def __str__(self) -> str:
         maxlength = max(
             [len(str(self.n_cols))] +
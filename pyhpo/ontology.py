@@ -36,6 +36,7 @@ class OntologyClass():
         data_folder: Optional[str] = None
     ) -> 'OntologyClass':
         self._map: Dict[int, HPOTerm] = {}
+        self._name_dict: Optional[Dict[str, HPOTerm]] = None
         self._genes: Set['pyhpo.GeneSingleton'] = set()
         self._omim_diseases: Set['pyhpo.DiseaseSingleton'] = set()
         self._orpha_diseases: Set['pyhpo.DiseaseSingleton'] = set()
@@ -218,6 +219,12 @@ class OntologyClass():
         if isinstance(query, str):
             if query.startswith('HP:'):
                 res = self[HPOTerm.id_from_string(query)]
+            elif query.isdecimal():
+                # Plain numeric strings, e.g. "2650", are treated
+                # as term ids, since no term name consists of digits
+                # only. isdecimal() only accepts strings that int()
+                # can parse, unlike isdigit()
+                res = self[int(query)]
             else:
                 res = self.synonym_match(query)
 
@@ -250,6 +257,10 @@ class OntologyClass():
             A single matching HPO term instance
         """
 
+        term = self._name_dict_lookup(query)
+        if term:
+            return term
+
         for term in self:
             if query == term.name:
                 return term
@@ -329,6 +340,10 @@ class OntologyClass():
             A single HPO term instance
 
         """
+        term = self._name_dict_lookup(query)
+        if term:
+            return term
+
         synonym_hit = None
         for term in self:
             if query == term.name:
@@ -472,11 +487,45 @@ class OntologyClass():
     def decipher_excluded_diseases(self) -> Set['pyhpo.DiseaseSingleton']:
         return self._decipher_excluded_diseases
 
+    def _name_dict_lookup(self, query: str) -> Optional[HPOTerm]:
+        """
+        Fast name-based lookup of an HPO term
+        through an index of all term names
+
+        The index is built on first use. Since term names can be
+        modified at runtime, every hit is verified against the
+        current name and ``None`` is returned on a miss so that
+        callers can fall back to a linear scan.
+
+        Parameters
+        ----------
+        query:  str
+            HPO term name to look up
+
+        Returns
+        -------
+        HPOTerm or None
+            The term with a matching name, if the index has a
+            verified hit
+        """
+        name_dict = self._name_dict
+        if name_dict is None:
+            name_dict = {}
+            for term in self:
+                name_dict.setdefault(term.name, term)
+            self._name_dict = name_dict
+
+        term = name_dict.get(query)
+        if term is not None and term.name == query:
+            return term
+        return None
+
     def _append(self, item: HPOTerm) -> None:
         """
         Adds one HPO term to the ontology
         """
         self._map[item._index] = item
+        self._name_dict = None
 
     def _connect_all(self) -> None:
         """
@@ -46,12 +46,13 @@ class HPOSet(set):
             HPOSet instance that contains only the most specific
             child nodes of the current HPOSet
         """
-        counter = {term.id: 0 for term in self}
-        for child, parent in self.combinations():
-            if child.child_of(parent):
-                counter[parent.id] += 1
+        ancestors: Set['pyhpo.HPOTerm'] = set()
+        for term in self:
+            # ``all_parents`` contains the term itself,
+            # so it must be excluded from the ancestor set
+            ancestors.update(term.all_parents.difference((term,)))
         return HPOSet([
-            term for term in self if counter[term.id] == 0
+            term for term in self if term not in ancestors
         ])
 
     def remove_modifier(self) -> 'HPOSet':
@@ -100,12 +101,10 @@ class HPOSet(set):
         ids: Set['pyhpo.HPOTerm'] = set()
         for term in self:
             if term.is_obsolete:
-                try:
-                    replaced = Ontology.get_hpo_object(
-                        term.replaced_by
-                    )
-                    ids.add(replaced)
-                except AttributeError:
+                replacement = getattr(term, 'replaced_by', None)
+                if replacement is not None:
+                    ids.add(Ontology.get_hpo_object(replacement))
+                else:
                     warnings.warn(
                         'The term {} is obsolete and has no replacement.'
                             .format(term),
@@ -125,11 +124,54 @@ class HPOSet(set):
         set of :class:`annotations.Gene`
             Set of all genes associated with the HPOTerms in the set
         """
-        genes = set()
-        for term in self:
-            genes.update(term.genes)
+        return set().union(*(term.genes for term in self))
+
+    def intersecting_genes(self) -> Set['pyhpo.GeneSingleton']:
+        """
+        Calculates the intersection of the genes
+        attached to the HPO Terms in this set
+
+        Returns
+        -------
+        set of :class:`annotations.Gene`
+            Set of genes associated with every HPOTerm in the set
+        """
+        # Sorting ascending by size ensures the smallest set
+        # drives the intersection
+        sets = sorted((term.genes for term in self), key=len)
+        if not sets:
+            return set()
+        genes = set(sets[0])
+        for other in sets[1:]:
+            genes &= other
+            if not genes:
+                # The intersection cannot recover from an empty set
+                break
         return genes
 
+    def intersecting_omim_diseases(self) -> Set['pyhpo.OmimDisease']:
+        """
+        Calculates the intersection of the Omim diseases
+        attached to the HPO Terms in this set
+
+        Returns
+        -------
+        set of :class:`annotations.Omim`
+            Set of Omim diseases associated with every HPOTerm in the set
+        """
+        # Sorting ascending by size ensures the smallest set
+        # drives the intersection
+        sets = sorted((term.omim_diseases for term in self), key=len)
+        if not sets:
+            return set()
+        diseases = set(sets[0])
+        for other in sets[1:]:
+            diseases &= other
+            if not diseases:
+                # The intersection cannot recover from an empty set
+                break
+        return diseases
+
     def omim_diseases(self) -> Set['pyhpo.OmimDisease']:
         """
         Calculates the union of the Omim diseases
@@ -140,10 +182,7 @@ class HPOSet(set):
         set of :class:`annotations.Omim`
             Set of all Omim diseases associated with the HPOTerms in the set
         """
-        omims = set()
-        for term in self:
-            omims.update(term.omim_diseases)
-        return omims
+        return set().union(*(term.omim_diseases for term in self))
 
     def orpha_diseases(self) -> Set['pyhpo.OrphaDisease']:
         """
@@ -155,10 +194,7 @@ class HPOSet(set):
         set of :class:`annotations.Omim`
             Set of all Omim diseases associated with the HPOTerms in the set
         """
-        orphas = set()
-        for term in self:
-            orphas.update(term.orpha_diseases)
-        return orphas
+        return set().union(*(term.orpha_diseases for term in self))
 
     def decipher_diseases(self) -> Set['pyhpo.DecipherDisease']:
         """
@@ -170,10 +206,7 @@ class HPOSet(set):
         set of :class:`annotations.Omim`
             Set of all Omim diseases associated with the HPOTerms in the set
         """
-        deciphers = set()
-        for term in self:
-            deciphers.update(term.decipher_diseases)
-        return deciphers
+        return set().union(*(term.decipher_diseases for term in self))
 
     def information_content(self, kind: str = '') -> Dict:
         """
@@ -376,15 +409,8 @@ class HPOSet(set):
 
         score_matrix = HPOSet._sim_score(self, other, kind, method)
 
-        row_maxes = [
-            max([v for v in row])
-            for row in score_matrix.rows
-        ]
-
-        col_maxes = [
-            max([v for v in col])
-            for col in score_matrix.columns
-        ]
+        row_maxes = score_matrix.row_maxes()
+        col_maxes = score_matrix.col_maxes()
 
         try:
             if combine == 'funSimAvg':
@@ -434,11 +460,7 @@ class HPOSet(set):
         if not len(self) or not len(other):
             return 0
 
-        matches = 0
-        for term1 in self:
-            for term2 in other:
-                if term1 == term2:
-                    matches += 1
+        matches = len(set.intersection(self, other))
         return matches / max([len(self), len(other)])
 
     @staticmethod
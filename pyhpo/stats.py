@@ -1,4 +1,6 @@
-from typing import List, Union, Tuple
+from collections import Counter
+from operator import itemgetter
+from typing import Dict, List, Optional, Union, Tuple
 
 try:
     from scipy.stats import hypergeom  # type: ignore[import]
@@ -74,15 +76,37 @@ class HPOEnrichment():
         * **gene**
         * **omim**
 
+    .. note::
+
+        The reference counts are built lazily upon first use of
+        :attr:`.HPOEnrichment.hpos` or :attr:`.HPOEnrichment.total`,
+        so instantiating the model itself is cheap.
+
     """
     def __init__(self, category: str) -> None:
         category_lookup = {
             'gene': Ontology.genes,
             'omim': Ontology.omim_diseases
         }
-        self.hpos, self.total = self._hpo_count(
-            category_lookup[category]  # type: ignore[arg-type]
-        )
+        self._background = category_lookup[category]
+        self._hpos: Optional[Dict] = None
+        self._total: int = 0
+
+    @property
+    def hpos(self) -> Dict:
+        if self._hpos is None:
+            self._hpos, self._total = self._hpo_count(
+                self._background  # type: ignore[arg-type]
+            )
+        return self._hpos
+
+    @property
+    def total(self) -> int:
+        if self._hpos is None:
+            self._hpos, self._total = self._hpo_count(
+                self._background  # type: ignore[arg-type]
+            )
+        return self._total
 
     def enrichment(
         self,
@@ -126,7 +150,7 @@ class HPOEnrichment():
             )} for hpo, count in list_counts.items()
         ]
 
-        return sorted(res, key=lambda x: x['enrichment'])
+        return sorted(res, key=itemgetter('enrichment'))
 
     def _hpo_count(
         self,
@@ -150,13 +174,12 @@ class HPOEnrichment():
                 * value: int <Number of occurences>
             * Total number of HPO terms in set
         """
-        hpos = {}
+        hpos: Dict = Counter()
         for item in annotation_sets:
-            for term in item.hpo:
-                if term not in hpos:
-                    hpos[term] = 0
-                hpos[term] += 1
-        return (hpos, sum(hpos.values()))
+            hpos.update(item.hpo)
+        # Return a plain dict so that missing keys raise KeyError,
+        # which _single_enrichment relies on for its error handling
+        return (dict(hpos), sum(hpos.values()))
 
     def _single_enrichment(
         self,
@@ -228,6 +251,13 @@ class EnrichmentModel():
         * **orpha**
         * **decipher**
 
+    .. note::
+
+        The reference counts are built lazily upon first use of
+        :attr:`.EnrichmentModel.base_count` or
+        :attr:`.EnrichmentModel.total`,
+        so instantiating the model itself is cheap.
+
     """
     attribute_lookup = {
         'gene': lambda x: x.genes,
@@ -245,7 +275,24 @@ class EnrichmentModel():
     def __init__(self, category: str) -> None:
         self.attribute = self.attribute_lookup[category]
         self.base = self.base_lookup[category]
-        self.base_count, self.total = self._population_count(HPOSet(Ontology))
+        self._base_count: Optional[Dict] = None
+        self._total: int = 0
+
+    @property
+    def base_count(self) -> Dict:
+        if self._base_count is None:
+            self._base_count, self._total = self._population_count(
+                HPOSet(Ontology)
+            )
+        return self._base_count
+
+    @property
+    def total(self) -> int:
+        if self._base_count is None:
+            self._base_count, self._total = self._population_count(
+                HPOSet(Ontology)
+            )
+        return self._total
 
     def enrichment(
         self,
@@ -286,7 +333,7 @@ class EnrichmentModel():
                 list_total
             )} for item, count in list_counts.items()
         ]
-        return sorted(res, key=lambda x: x['enrichment'])
+        return sorted(res, key=itemgetter('enrichment'))
 
     def _population_count(self, hopset: HPOSet) -> Tuple[dict, int]:
         """
@@ -305,13 +352,12 @@ class EnrichmentModel():
                 * value: int <Number of occurences>
             * Total number of annotations in set
         """
-        population = {}
+        population: Dict = Counter()
         for term in hopset:
-            for item in self.attribute(term):
-                if item not in population:
-                    population[item] = 0
-                population[item] += 1
-        return population, sum(population.values())
+            population.update(self.attribute(term))
+        # Return a plain dict so that missing keys raise KeyError,
+        # which _single_enrichment relies on for its error handling
+        return dict(population), sum(population.values())
 
     def _single_enrichment(
         self,
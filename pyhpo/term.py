@@ -1,5 +1,6 @@
 import warnings
 import math
+from functools import lru_cache
 from typing import List, Set, Tuple, Optional, Union, Dict, Any
 
 import pyhpo
@@ -320,6 +321,7 @@ class HPOTerm():
         self._id: str = ''
         self._index: int = 0
         self._hash: Optional[int] = None
+        self._json: Optional[Dict] = None
 
         self._alt_id: List[str] = []
         self._alt_index: List[int] = []
@@ -983,6 +985,12 @@ class HPOTerm():
         """
         Creates a JSON-like object of the HPOTerm
 
+        .. note::
+
+            The non-verbose dict is built only once per term and cached,
+            since the underlying attributes do not change once the
+            ontology is loaded.
+
         Parameters
         ----------
         verbose: bool, default ``False``
@@ -1016,13 +1024,16 @@ class HPOTerm():
             }
 
         """
-        res = {
-            'int': int(self),
-            'id': self.id,
-            'name': self.name
-        }
+        if self._json is None:
+            self._json = {
+                'int': int(self),
+                'id': self.id,
+                'name': self.name
+            }
+        res = self._json
 
         if verbose:
+            res = dict(res)
             res['definition'] = self.definition
             res['comment'] = self.comment
             res['synonym'] = self._synonym
@@ -1129,10 +1140,16 @@ class HPOTerm():
         return 1/(dist + 1)
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def id_from_string(hpo_string: str) -> int:
         """
         Formats the HPO-type Term-ID into an integer id
 
+        .. note::
+
+            The parsed IDs are cached, so repeated lookups
+            of the same HPO-ID string skip the string parsing
+
         Parameters
         ----------
         hpo_string: str
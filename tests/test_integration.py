@@ -144,26 +144,24 @@ class IntegrationFullTest(unittest.TestCase):
 
     def test_annotation_inheritance(self):
         for term in self.terms:
-            lg = len(term.genes)
-            lo = len(term.omim_diseases)
-            lorpha = len(term.orpha_diseases)
-            ld = len(term.decipher_diseases)
+            genes = term.genes
+            omim = term.omim_diseases
+            orpha = term.orpha_diseases
+            decipher = term.decipher_diseases
 
             for child in term.children:
                 with self.subTest(t=term.id, c=child.id):
-                    assert lg >= len(child.genes)
-                    assert child.genes.issubset(term.genes)
+                    assert len(genes) >= len(child.genes)
+                    assert child.genes.issubset(genes)
 
-                    assert lo >= len(child.omim_diseases)
-                    assert child.omim_diseases.issubset(term.omim_diseases)
+                    assert len(omim) >= len(child.omim_diseases)
+                    assert child.omim_diseases.issubset(omim)
 
-                    assert lorpha >= len(child.orpha_diseases)
-                    assert child.orpha_diseases.issubset(term.orpha_diseases)
+                    assert len(orpha) >= len(child.orpha_diseases)
+                    assert child.orpha_diseases.issubset(orpha)
 
-                    assert ld >= len(child.decipher_diseases)
-                    assert child.decipher_diseases.issubset(
-                        term.decipher_diseases
-                    )
+                    assert len(decipher) >= len(child.decipher_diseases)
+                    assert child.decipher_diseases.issubset(decipher)
 
     def test_relationships(self):
         kidney = self.terms.get_hpo_object(123)
@@ -141,6 +141,34 @@ class MatrixReadingTests(unittest.TestCase):
             [3]
         )
 
+    def test_row_maxes(self):
+        self.assertEqual(
+            self.a.row_maxes(),
+            [14, 24, 34]
+        )
+        self.assertEqual(
+            self.singlecol.row_maxes(),
+            [1, 2, 3]
+        )
+        self.assertEqual(
+            self.singlerow.row_maxes(),
+            [3]
+        )
+
+    def test_col_maxes(self):
+        self.assertEqual(
+            self.a.col_maxes(),
+            [31, 32, 33, 34]
+        )
+        self.assertEqual(
+            self.singlecol.col_maxes(),
+            [3]
+        )
+        self.assertEqual(
+            self.singlerow.col_maxes(),
+            [1, 2, 3]
+        )
+
     def test_errors(self):
         a = self.a
 
@@ -5,7 +5,8 @@ import warnings
 from pyhpo.set import HPOSet, BasicHPOSet
 from pyhpo.term import HPOTerm
 from pyhpo.matrix import Matrix
-from tests.mockontology import make_terms, make_ontology, make_ontology_with_modifiers
+from tests.mockontology import make_terms, make_ontology, \
+    make_ontology_with_modifiers, make_genes, make_omim
 
 
 class SetMethods(unittest.TestCase):
@@ -303,6 +304,79 @@ class SetInitTests(unittest.TestCase):
             )
 
 
+class SetAnnotationIntersectionTests(unittest.TestCase):
+    def setUp(self):
+        self.ontology = make_ontology()
+
+    def test_intersecting_genes(self):
+        genes = make_genes(3)
+        self.ontology[13].genes = {genes[0], genes[1]}
+        self.ontology[41].genes = {genes[1], genes[2]}
+
+        self.assertEqual(
+            HPOSet([]).intersecting_genes(),
+            set()
+        )
+        self.assertEqual(
+            HPOSet([self.ontology[13]]).intersecting_genes(),
+            {genes[0], genes[1]}
+        )
+        self.assertEqual(
+            HPOSet([
+                self.ontology[13],
+                self.ontology[41]
+            ]).intersecting_genes(),
+            {genes[1]}
+        )
+
+    def test_intersecting_genes_disjoint(self):
+        genes = make_genes(2)
+        self.ontology[13].genes = {genes[0]}
+        self.ontology[41].genes = {genes[1]}
+
+        self.assertEqual(
+            HPOSet([
+                self.ontology[13],
+                self.ontology[41]
+            ]).intersecting_genes(),
+            set()
+        )
+
+    def test_intersecting_omim_diseases(self):
+        omim = make_omim(3)
+        self.ontology[13].omim_diseases = {omim[0], omim[1]}
+        self.ontology[41].omim_diseases = {omim[1], omim[2]}
+
+        self.assertEqual(
+            HPOSet([]).intersecting_omim_diseases(),
+            set()
+        )
+        self.assertEqual(
+            HPOSet([self.ontology[13]]).intersecting_omim_diseases(),
+            {omim[0], omim[1]}
+        )
+        self.assertEqual(
+            HPOSet([
+                self.ontology[13],
+                self.ontology[41]
+            ]).intersecting_omim_diseases(),
+            {omim[1]}
+        )
+
+    def test_intersecting_omim_diseases_disjoint(self):
+        omim = make_omim(2)
+        self.ontology[13].omim_diseases = {omim[0]}
+        self.ontology[41].omim_diseases = {omim[1]}
+
+        self.assertEqual(
+            HPOSet([
+                self.ontology[13],
+                self.ontology[41]
+            ]).intersecting_omim_diseases(),
+            set()
+        )
+
+
 class BasicHPOSetTests(unittest.TestCase):
     def test_init(self):
         ontology = make_ontology()
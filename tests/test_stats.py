@@ -52,12 +52,20 @@ class TestHPOEnrichment(unittest.TestCase):
             '_hpo_count',
             return_value=({}, 15)
         ) as patch_hpo_count:
-            _ = HPOEnrichment('gene')
+            model = HPOEnrichment('gene')
+            # The reference counts are built lazily
+            patch_hpo_count.assert_not_called()
+            _ = model.hpos
             patch_hpo_count.assert_called_once_with(
                 self.ontology.genes
             )
+            # Repeated access must not recount
+            _ = model.total
+            patch_hpo_count.assert_called_once()
+
             patch_hpo_count.reset_mock()
-            _ = HPOEnrichment('omim')
+            model = HPOEnrichment('omim')
+            _ = model.hpos
             patch_hpo_count.assert_called_once_with(
                 self.ontology.omim_diseases
             )
@@ -109,6 +117,23 @@ class TestHPOEnrichment(unittest.TestCase):
             )
             self.assertEqual(res, 1212)
 
+    def test_single_enrichment_missing_reference(self):
+        # Run against the real reference counts (no mocking)
+        # to ensure missing terms raise instead of counting as 0
+        model = HPOEnrichment('gene')
+        with self.assertRaises(RuntimeError) as context:
+            model._single_enrichment(
+                'hypergeom',
+                self.ontology[41],
+                1,
+                2
+            )
+        self.assertEqual(
+            'The HPO term {} is not present in the '
+            'reference population'.format(self.ontology[41]),
+            str(context.exception)
+        )
+
     def test_single_enrichment_error(self):
         mocktotal = MagicMock()
         mocktotal.hpos = {'bar': 'foo'}
@@ -181,9 +206,15 @@ class TestAnnotationEnrichment(unittest.TestCase):
             return_value=({}, 15)
         ) as patch_count:
             res = EnrichmentModel('gene')
+            # The reference counts are built lazily
+            patch_count.assert_not_called()
+            _ = res.base_count
             patch_count.assert_called_once_with(
                 HPOSet(self.ontology)
             )
+            # Repeated access must not recount
+            _ = res.total
+            patch_count.assert_called_once()
             self.assertEqual(
                 res.attribute,
                 res.attribute_lookup['gene']
@@ -248,6 +279,23 @@ class TestAnnotationEnrichment(unittest.TestCase):
             )
             self.assertEqual(res, 1212)
 
+    def test_single_enrichment_missing_reference(self):
+        # Run against the real reference counts (no mocking)
+        # to ensure missing items raise instead of counting as 0
+        model = EnrichmentModel('gene')
+        with self.assertRaises(RuntimeError) as context:
+            model._single_enrichment(
+                'hypergeom',
+                'inexistent',
+                1,
+                2
+            )
+        self.assertEqual(
+            'The item inexistent is not present in the '
+            'reference population',
+            str(context.exception)
+        )
+
     def test_single_enrichment_error(self):
         that = MagicMock()
         that.base_count = {'bar': 'foo'}
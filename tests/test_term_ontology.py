@@ -500,6 +500,20 @@ class OntologyQueries(unittest.TestCase):
             self.terms.get_hpo_object(12),
             self.child_1_2
         )
+        self.assertEqual(
+            self.terms.get_hpo_object('12'),
+            self.child_1_2
+        )
+        with self.assertRaises(RuntimeError) as err:
+            self.terms.get_hpo_object('999')
+        assert 'Unknown HPO term' in str(err.exception)
+
+        # Superscript digits pass isdigit() but are not valid
+        # for int(), so they must go through the name lookup
+        with self.assertRaises(RuntimeError) as err:
+            self.terms.get_hpo_object('²')
+        assert 'No HPO entry with term' in str(err.exception)
+
         with self.assertRaises(SyntaxError) as err:
             self.terms.get_hpo_object([1, 2, 3])
         assert 'Invalid type' in str(err.exception)